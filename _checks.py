@@ -0,0 +1,57 @@
+"""
+Shared dependency checks for the local tooling scripts.
+
+run_local.py and validate_setup.py both need to know whether the
+project's required packages are importable; the package list and the
+lookup live here so the two scripts stay in sync.
+"""
+
+import sys
+from typing import Iterable, List
+
+# Import names of the packages the app needs at runtime
+REQUIRED_PACKAGES = frozenset({
+    "fastapi",
+    "uvicorn",
+    "streamlit",
+    "groq",
+    "pydantic",
+    "httpx",
+    "orjson",
+    "dotenv"
+})
+
+
+def missing_packages(packages: Iterable[str] = REQUIRED_PACKAGES) -> List[str]:
+    """
+    Return the packages that are not importable.
+
+    Modules already in sys.modules are importable by definition, so a
+    set comparison short-circuits the find_spec scan entirely when
+    everything is loaded.
+
+    Args:
+        packages (Iterable[str]): Import names to check.
+
+    Returns:
+        List[str]: Sorted import names with no locatable spec.
+    """
+    wanted = frozenset(packages)
+    if wanted <= sys.modules.keys():
+        return []
+
+    import importlib.util
+
+    missing = []
+    for package in sorted(wanted):
+        if package in sys.modules:
+            continue
+        # find_spec only walks the path finders; the module is never executed
+        try:
+            spec = importlib.util.find_spec(package)
+        except ModuleNotFoundError:
+            spec = None
+        if spec is None:
+            missing.append(package)
+
+    return missing
@@ -4,142 +4,176 @@ FastAPI backend application for Simple Groq App.
 This module contains the main FastAPI application with Groq integration.
 """
 
-from fastapi import FastAPI, HTTPException, status
+import os
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, HTTPException, Response, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+import orjson
 import uvicorn
 
-from backend.models.chat_models import ChatRequest, ChatResponse, HealthResponse
+from backend.models.chat_models import ChatRequest
 from backend.services.groq_service import GroqService
 from backend.utils.config import config
 
 
-# Initialize FastAPI app
-app = FastAPI(
-    title=config.APP_NAME,
-    version=config.APP_VERSION,
-    description="A simple application using FastAPI backend with Groq AI integration",
-    docs_url="/docs" if config.DEBUG else None,
-    redoc_url="/redoc" if config.DEBUG else None
-)
+class SelectiveGZipMiddleware(GZipMiddleware):
+    """
+    GZip middleware that leaves streaming paths uncompressed.
+
+    The pinned starlette's GZipResponder collects streamed chunks in the
+    zlib buffer without sync-flushing, so compressing /chat would hold
+    the NDJSON deltas back until the stream closes for any client that
+    advertises gzip support (httpx does by default).
+    """
+
+    EXCLUDED_PATHS = frozenset({"/chat"})
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] in self.EXCLUDED_PATHS:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
 
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=config.ALLOWED_ORIGINS,
-    allow_credentials=True,
-    allow_methods=["GET", "POST"],
-    allow_headers=["*"],
-)
 
 # Initialize Groq service
 groq_service = None
 
+# Health payloads never change after startup, so they are rendered to JSON
+# bytes once instead of rebuilding a HealthResponse per call.
+root_body = b""
+health_body = b""
+models_body = b""
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize services on startup and release them on shutdown."""
+    global groq_service, root_body, health_body, models_body
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize services on application startup."""
-    global groq_service
-    
     # Validate configuration
     if not config.validate_config():
         raise RuntimeError("Invalid configuration. Please check environment variables.")
-    
+
+    # Pre-render the static health payloads
+    root_body = orjson.dumps({
+        "status": "healthy",
+        "message": f"Welcome to {config.APP_NAME}!",
+        "version": config.APP_VERSION
+    })
+    health_body = orjson.dumps({
+        "status": "healthy",
+        "message": "Application is running smoothly",
+        "version": config.APP_VERSION
+    })
+
     # Initialize Groq service
     try:
         groq_service = GroqService(api_key=config.GROQ_API_KEY)
+        models_body = orjson.dumps({"models": groq_service.get_available_models()})
         print(f"✅ {config.APP_NAME} started successfully!")
     except Exception as e:
         print(f"❌ Failed to initialize Groq service: {str(e)}")
         raise RuntimeError(f"Failed to initialize Groq service: {str(e)}")
 
+    yield
+
+    # Release pooled connections on shutdown
+    await groq_service.client.close()
+
+
+# Initialize FastAPI app
+app = FastAPI(
+    title=config.APP_NAME,
+    version=config.APP_VERSION,
+    description="A simple application using FastAPI backend with Groq AI integration",
+    openapi_url="/openapi.json" if config.DEBUG else None,
+    docs_url="/docs" if config.DEBUG else None,
+    redoc_url="/redoc" if config.DEBUG else None,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
+
+# Compress text-heavy responses; the /chat stream stays uncompressed so
+# deltas reach the client as they are produced
+app.add_middleware(SelectiveGZipMiddleware, minimum_size=512, compresslevel=5)
+
+# Add CORS middleware
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=config.ALLOWED_ORIGINS,
+    allow_credentials=True,
+    allow_methods=["GET", "POST"],
+    allow_headers=["*"],
+)
 
-@app.get("/", response_model=HealthResponse)
+
+@app.get("/")
 async def root():
     """
     Root endpoint for basic health check.
-    
+
     Returns:
-        HealthResponse: Basic application information.
+        Response: Basic application information, pre-rendered at startup.
     """
-    return HealthResponse(
-        status="healthy",
-        message=f"Welcome to {config.APP_NAME}!",
-        version=config.APP_VERSION
-    )
+    return Response(content=root_body, media_type="application/json")
 
 
-@app.get("/health", response_model=HealthResponse)
+@app.get("/health")
 async def health_check():
     """
     Health check endpoint.
-    
+
     Returns:
-        HealthResponse: Detailed health status.
+        Response: Detailed health status, pre-rendered at startup.
     """
-    return HealthResponse(
-        status="healthy",
-        message="Application is running smoothly",
-        version=config.APP_VERSION
-    )
+    return Response(content=health_body, media_type="application/json")
 
 
 @app.get("/models")
 async def get_models():
     """
     Get available Groq models.
-    
+
     Returns:
-        dict: List of available models.
+        Response: List of available models, pre-rendered at startup.
     """
     if not groq_service:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Groq service not initialized"
         )
-    
-    models = groq_service.get_available_models()
-    return {"models": models}
+
+    return Response(content=models_body, media_type="application/json")
 
 
-@app.post("/chat", response_model=ChatResponse)
+@app.post("/chat")
 async def chat_completion(request: ChatRequest):
     """
-    Generate chat completion using Groq API.
-    
+    Stream a chat completion from the Groq API.
+
     Args:
         request (ChatRequest): Chat request with message and parameters.
-        
+
     Returns:
-        ChatResponse: Generated response from Groq.
-        
+        StreamingResponse: Newline-delimited JSON chunks ("delta" content
+            chunks, a final "tokens_used" chunk, or an in-band "error").
+
     Raises:
-        HTTPException: If service is unavailable or request fails.
+        HTTPException: If the Groq service is unavailable.
     """
     if not groq_service:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Groq service not initialized"
         )
-    
-    try:
-        response = await groq_service.chat_completion(request)
-        
-        if not response.success:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=response.response
-            )
-        
-        return response
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Unexpected error: {str(e)}"
-        )
+
+    return StreamingResponse(
+        groq_service.chat_completion(request),
+        media_type="application/x-ndjson"
+    )
 
 
 @app.exception_handler(Exception)
@@ -152,9 +186,9 @@ async def global_exception_handler(request, exc):
         exc: Exception that occurred.
         
     Returns:
-        JSONResponse: Error response.
+        ORJSONResponse: Error response.
     """
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": "Internal server error",
@@ -171,8 +205,12 @@ def main():
         "backend.main:app",
         host=config.HOST,
         port=config.PORT,
+        loop="uvloop",
+        http="httptools",
+        workers=1 if config.DEBUG else int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
         reload=config.DEBUG,
-        log_level="info"
+        log_level="info" if config.DEBUG else "warning",
+        access_log=config.DEBUG
     )
 
 
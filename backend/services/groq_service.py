@@ -5,9 +5,20 @@ This module handles communication with the Groq API for language model inference
 """
 
 import os
-from typing import List, Dict, Any
-from groq import Groq
-from backend.models.chat_models import ChatMessage, ChatRequest, ChatResponse
+from typing import AsyncIterator, List, Dict
+import httpx
+import orjson
+from groq import AsyncGroq
+from backend.models.chat_models import MAX_HISTORY_MESSAGES, ChatRequest
+
+
+# Common Groq models (this could be fetched from API in production)
+AVAILABLE_MODELS = (
+    "llama-3.1-8b-instant",
+)
+
+# Roles forwarded to the Groq API
+_ALLOWED_ROLES = frozenset({"system", "user", "assistant"})
 
 
 class GroqService:
@@ -27,7 +38,16 @@ class GroqService:
         if not self.api_key:
             raise ValueError("Groq API key is required. Set GROQ_API_KEY environment variable.")
         
-        self.client = Groq(api_key=self.api_key)
+        # Async client with a pooled HTTP/2 transport so connections to
+        # api.groq.com stay warm across requests.
+        self.client = AsyncGroq(
+            api_key=self.api_key,
+            http_client=httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=100),
+                timeout=60
+            )
+        )
     
     def _format_messages(self, request: ChatRequest) -> List[Dict[str, str]]:
         """
@@ -39,66 +59,61 @@ class GroqService:
         Returns:
             List[Dict[str, str]]: Formatted messages for Groq API.
         """
-        messages = []
-        
-        # Add system message if available
-        if request.history:
-            for msg in request.history:
-                if msg.role in ["system", "user", "assistant"]:
-                    messages.append({"role": msg.role, "content": msg.content})
-        
+        # History entries are already plain {"role", "content"} dicts; keep
+        # only the most recent entries to cap prompt size.
+        messages = [
+            msg for msg in request.history[-MAX_HISTORY_MESSAGES:]
+            if msg.get("role") in _ALLOWED_ROLES
+        ]
+
         # Add current user message
         messages.append({"role": "user", "content": request.message})
-        
+
         return messages
     
-    async def chat_completion(self, request: ChatRequest) -> ChatResponse:
+    async def chat_completion(self, request: ChatRequest) -> AsyncIterator[bytes]:
         """
-        Generate chat completion using Groq API.
-        
+        Stream a chat completion from the Groq API.
+
         Args:
             request (ChatRequest): Chat request parameters.
-            
-        Returns:
-            ChatResponse: Generated response from Groq.
-            
-        Raises:
-            Exception: If API call fails or returns invalid response.
+
+        Yields:
+            bytes: Newline-delimited JSON chunks. Content chunks carry a
+                "delta" key, the final chunk reports "tokens_used", and
+                failures are reported under an "error" key.
         """
         try:
             messages = self._format_messages(request)
-            
-            # Make API call to Groq
-            completion = self.client.chat.completions.create(
+
+            # Make API call to Groq and relay chunks as they arrive
+            stream = await self.client.chat.completions.create(
                 model=request.model,
                 messages=messages,
                 max_tokens=request.max_tokens,
                 temperature=request.temperature,
-                stream=False
-            )
-            
-            # Extract response data
-            response_content = completion.choices[0].message.content
-            tokens_used = completion.usage.total_tokens if completion.usage else 0
-            
-            return ChatResponse(
-                response=response_content,
-                model=request.model,
-                tokens_used=tokens_used,
-                success=True
+                stream=True
             )
-            
+
+            async for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    yield orjson.dumps({"delta": delta}) + b"\n"
+
+                # The final chunk carries usage stats under x_groq
+                x_groq = getattr(chunk, "x_groq", None)
+                if x_groq and x_groq.usage:
+                    yield orjson.dumps({
+                        "model": request.model,
+                        "tokens_used": x_groq.usage.total_tokens
+                    }) + b"\n"
+
         except Exception as e:
             # Log error (in production, use proper logging)
             print(f"Groq API error: {str(e)}")
-            
-            # Return error response
-            return ChatResponse(
-                response=f"Error generating response: {str(e)}",
-                model=request.model,
-                tokens_used=0,
-                success=False
-            )
+
+            # Report the error in-band so the client can surface it
+            yield orjson.dumps({"error": f"Error generating response: {str(e)}"}) + b"\n"
     
     def get_available_models(self) -> List[str]:
         """
@@ -107,7 +122,4 @@ class GroqService:
         Returns:
             List[str]: List of available model names.
         """
-        # Common Groq models (this could be fetched from API in production)
-        return [
-            "llama-3.1-8b-instant"
-        ]
+        return list(AVAILABLE_MODELS)
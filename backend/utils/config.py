@@ -5,7 +5,7 @@ This module handles application configuration and environment variables.
 """
 
 import os
-from typing import List
+from typing import Tuple
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -28,10 +28,11 @@ class Config:
     GROQ_API_KEY: str = os.getenv("GROQ_API_KEY", "")
     
     # CORS settings
-    ALLOWED_ORIGINS: List[str] = [
-        origin.strip() 
+    ALLOWED_ORIGINS: Tuple[str, ...] = tuple(
+        origin.strip()
         for origin in os.getenv("ALLOWED_ORIGINS", "http://localhost:8501").split(",")
-    ]
+        if origin.strip()
+    )
     
     @classmethod
     def validate_config(cls) -> bool:
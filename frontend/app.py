@@ -4,11 +4,14 @@ Streamlit frontend application for Simple Groq App.
 This module contains the main Streamlit application interface.
 """
 
+import asyncio
 import os
 import sys
-import requests
+import threading
+import httpx
+import orjson
 import streamlit as st
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
 # Add the project root to Python path for imports
 # sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -25,6 +28,113 @@ from frontend.components.chat_interface import (
 # Configuration
 BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:8000")
 
+@st.cache_resource
+def get_http() -> httpx.Client:
+    """
+    HTTP client reused across Streamlit reruns.
+
+    Streamlit re-executes this script on every interaction, so the
+    client lives behind cache_resource (which also owns its lifetime);
+    a module-level instance would be rebuilt — and its keep-alive pool
+    discarded — per rerun.
+    """
+    return httpx.Client(
+        base_url=BACKEND_URL,
+        http2=True,
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+    )
+
+
+# Streamlit runs each session in its own thread but the cached loop is
+# process-wide; serialize access so concurrent sessions can't re-enter it.
+_loop_lock = threading.Lock()
+
+
+@st.cache_resource
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """Event loop reused across Streamlit reruns."""
+    return asyncio.new_event_loop()
+
+
+@st.cache_resource
+def get_async_http() -> httpx.AsyncClient:
+    """Async HTTP client reused across reruns, sharing one connection pool."""
+    return httpx.AsyncClient(
+        base_url=BACKEND_URL,
+        http2=True,
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+    )
+
+
+def prefetch_backend_state() -> Tuple[str, List[str]]:
+    """
+    Probe /health and /models concurrently on the reused event loop.
+
+    Returns:
+        Tuple[str, List[str]]: Backend status string and available models.
+    """
+    async def _gather():
+        client = get_async_http()
+        return await asyncio.gather(
+            client.get("/health", timeout=5),
+            client.get("/models", timeout=10),
+            return_exceptions=True
+        )
+
+    with _loop_lock:
+        health_resp, models_resp = get_event_loop().run_until_complete(_gather())
+
+    if isinstance(health_resp, Exception):
+        status = f"error: {str(health_resp)}"
+    else:
+        status = "healthy" if health_resp.status_code == 200 else "unhealthy"
+
+    models = ["mixtral-8x7b-32768"]
+    if not isinstance(models_resp, Exception) and models_resp.status_code == 200:
+        models = models_resp.json().get("models", models)
+
+    return status, models
+
+
+@st.cache_data(ttl=30)
+def fetch_backend_status(backend_url: str) -> str:
+    """
+    Probe backend health, cached for 30 seconds across reruns.
+
+    Args:
+        backend_url (str): Backend base URL (part of the cache key).
+
+    Returns:
+        str: "healthy", "unhealthy", or an "error: ..." description.
+    """
+    try:
+        response = get_http().get("/health", timeout=5)
+        return "healthy" if response.status_code == 200 else "unhealthy"
+    except Exception as e:
+        return f"error: {str(e)}"
+
+
+@st.cache_data(ttl=300)
+def fetch_models(backend_url: str) -> List[str]:
+    """
+    Fetch the model list from the backend, cached for 5 minutes.
+
+    Args:
+        backend_url (str): Backend base URL (part of the cache key).
+
+    Returns:
+        List[str]: Available model names, or the default on failure.
+    """
+    try:
+        response = get_http().get("/models", timeout=10)
+        if response.status_code == 200:
+            return response.json().get("models", ["mixtral-8x7b-32768"])
+    except Exception:
+        pass
+    return ["mixtral-8x7b-32768"]
+
 
 class StreamlitApp:
     """Main Streamlit application class."""
@@ -61,17 +171,8 @@ class StreamlitApp:
         Returns:
             bool: True if backend is healthy, False otherwise.
         """
-        try:
-            response = requests.get(f"{BACKEND_URL}/health", timeout=5)
-            if response.status_code == 200:
-                st.session_state.backend_status = "healthy"
-                return True
-            else:
-                st.session_state.backend_status = "unhealthy"
-                return False
-        except Exception as e:
-            st.session_state.backend_status = f"error: {str(e)}"
-            return False
+        st.session_state.backend_status = fetch_backend_status(BACKEND_URL)
+        return st.session_state.backend_status == "healthy"
     
     def fetch_available_models(self) -> List[str]:
         """
@@ -80,65 +181,77 @@ class StreamlitApp:
         Returns:
             List[str]: List of available model names.
         """
-        try:
-            response = requests.get(f"{BACKEND_URL}/models", timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                models = data.get("models", ["mixtral-8x7b-32768"])
-                st.session_state.available_models = models
-                return models
-            else:
-                return ["mixtral-8x7b-32768"]
-        except Exception as e:
-            st.warning(f"Could not fetch models: {str(e)}")
-            return ["mixtral-8x7b-32768"]
+        models = fetch_models(BACKEND_URL)
+        st.session_state.available_models = models
+        return models
     
-    def send_chat_request(self, message: str, model: str, settings: Dict[str, Any]) -> Dict[str, Any]:
+    def send_chat_request(self, message: str, model: str, settings: Dict[str, Any]):
         """
-        Send chat request to the backend.
-        
+        Stream a chat response from the backend.
+
         Args:
             message (str): User message.
             model (str): Selected model.
             settings (Dict[str, Any]): Chat settings.
-            
+
         Returns:
-            Dict[str, Any]: Response from the backend.
+            Tuple[Iterator[str], Dict[str, Any]]: A generator of response
+                text deltas, and a metadata dict whose "error" and
+                "tokens_used" keys are filled in as the stream is consumed.
         """
-        try:
-            # Prepare chat history for the API
-            history = []
-            for msg in st.session_state.messages:
-                if msg.get("role") in ["user", "assistant"]:
-                    history.append({
-                        "role": msg["role"],
-                        "content": msg["content"]
-                    })
-            
-            # Prepare request payload
-            payload = {
-                "message": message,
-                "model": model,
-                "max_tokens": settings["max_tokens"],
-                "temperature": settings["temperature"],
-                "history": history
-            }
-            
-            # Send request to backend
-            response = requests.post(
-                f"{BACKEND_URL}/chat",
-                json=payload,
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                error_detail = response.json().get("detail", "Unknown error")
-                return {"error": f"API Error: {error_detail}"}
-                
-        except Exception as e:
-            return {"error": f"Request failed: {str(e)}"}
+        # Session state already stores {"role", "content"} dicts, so pass
+        # them through as-is; the backend is the single validation point.
+        # Only the most recent messages are sent — the backend caps history
+        # at 32 entries per request.
+        history = [
+            msg for msg in st.session_state.messages
+            if msg.get("role") in ("user", "assistant")
+        ][-32:]
+
+        # Prepare request payload
+        payload = {
+            "message": message,
+            "model": model,
+            "max_tokens": settings["max_tokens"],
+            "temperature": settings["temperature"],
+            "history": history
+        }
+
+        # Encode once with orjson instead of going through httpx's
+        # stdlib-json path.
+        body = orjson.dumps(payload)
+
+        meta = {"error": None, "tokens_used": 0}
+
+        def token_stream():
+            try:
+                with get_http().stream(
+                    "POST", "/chat",
+                    content=body,
+                    headers={"Content-Type": "application/json"},
+                    timeout=60
+                ) as response:
+                    if response.status_code != 200:
+                        error_detail = orjson.loads(response.read()).get("detail", "Unknown error")
+                        meta["error"] = f"API Error: {error_detail}"
+                        return
+
+                    for line in response.iter_lines():
+                        if not line:
+                            continue
+                        chunk = orjson.loads(line)
+                        if "delta" in chunk:
+                            yield chunk["delta"]
+                        elif "tokens_used" in chunk:
+                            meta["tokens_used"] = chunk["tokens_used"]
+                        elif "error" in chunk:
+                            meta["error"] = chunk["error"]
+                            return
+
+            except Exception as e:
+                meta["error"] = f"Request failed: {str(e)}"
+
+        return token_stream(), meta
     
     def render_header(self):
         """Render the application header."""
@@ -159,17 +272,19 @@ class StreamlitApp:
         with col2:
             if st.button("🔄 Refresh Status"):
                 with st.spinner("Checking backend..."):
+                    fetch_backend_status.clear()
                     self.check_backend_health()
                 st.rerun()
     
     def render_main_interface(self):
         """Render the main chat interface."""
-        # Check backend health on startup
+        # Check backend health on startup (single parallel round-trip)
         if st.session_state.backend_status == "unknown":
             with st.spinner("Connecting to backend..."):
-                health_ok = self.check_backend_health()
-                if health_ok:
-                    self.fetch_available_models()
+                status, models = prefetch_backend_state()
+                st.session_state.backend_status = status
+                if status == "healthy":
+                    st.session_state.available_models = models
         
         # Chat settings sidebar
         settings = render_chat_settings()
@@ -179,6 +294,7 @@ class StreamlitApp:
             st.header("🤖 Model Selection")
             if st.button("🔄 Refresh Models"):
                 with st.spinner("Fetching models..."):
+                    fetch_models.clear()
                     self.fetch_available_models()
             
             selected_model = render_model_selector(st.session_state.available_models)
@@ -205,13 +321,13 @@ class StreamlitApp:
             with st.chat_message("user"):
                 st.write(prompt)
             
-            # Generate response
+            # Stream the response, rendering tokens as they arrive
             with st.chat_message("assistant"):
-                with st.spinner("Generating response..."):
-                    response = self.send_chat_request(prompt, selected_model, settings)
-                
-                if "error" in response:
-                    error_msg = response["error"]
+                token_stream, meta = self.send_chat_request(prompt, selected_model, settings)
+                assistant_response = st.write_stream(token_stream)
+
+                if meta["error"]:
+                    error_msg = meta["error"]
                     st.error(f"❌ {error_msg}")
                     # Add error to history
                     st.session_state.messages.append({
@@ -219,19 +335,15 @@ class StreamlitApp:
                         "content": f"Error: {error_msg}"
                     })
                 else:
-                    assistant_response = response.get("response", "No response generated.")
-                    st.write(assistant_response)
-                    
                     # Add assistant message to history
                     st.session_state.messages.append({
                         "role": "assistant",
-                        "content": assistant_response
+                        "content": assistant_response or "No response generated."
                     })
-                    
+
                     # Show token usage info
-                    tokens_used = response.get("tokens_used", 0)
-                    if tokens_used > 0:
-                        st.caption(f"Tokens used: {tokens_used}")
+                    if meta["tokens_used"] > 0:
+                        st.caption(f"Tokens used: {meta['tokens_used']}")
     
     def render_footer(self):
         """Render the application footer."""
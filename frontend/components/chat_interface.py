@@ -16,37 +16,8 @@ def render_chat_message(message: Dict[str, Any], is_user: bool = True):
         message (Dict[str, Any]): Message data containing content and metadata.
         is_user (bool): Whether the message is from the user or assistant.
     """
-    if is_user:
-        with st.container():
-            st.markdown(
-                f"""
-                <div style="
-                    background-color: #e3f2fd;
-                    padding: 10px;
-                    border-radius: 10px;
-                    margin: 10px 0;
-                    text-align: right;
-                ">
-                    <strong>You:</strong> {message['content']}
-                </div>
-                """,
-                unsafe_allow_html=True
-            )
-    else:
-        with st.container():
-            st.markdown(
-                f"""
-                <div style="
-                    background-color: #f5f5f5;
-                    padding: 10px;
-                    border-radius: 10px;
-                    margin: 10px 0;
-                ">
-                    <strong>Assistant:</strong> {message['content']}
-                </div>
-                """,
-                unsafe_allow_html=True
-            )
+    with st.chat_message("user" if is_user else "assistant"):
+        st.write(message["content"])
 
 
 def render_chat_history(messages: List[Dict[str, Any]]):
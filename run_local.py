@@ -8,42 +8,198 @@ This script helps start the application for local development.
 import os
 import sys
 import subprocess
+import selectors
+import threading
 import time
 import signal
-from typing import List
-from dotenv import load_dotenv
+from typing import Any, List, Optional
+
+from _checks import missing_packages
+
+
+class SpawnedProcess:
+    """
+    Minimal Popen-compatible handle around os.posix_spawn.
+
+    posix_spawn avoids fork()'s copy-on-write duplication of the parent
+    address space, which matters once the runner has imported heavyweight
+    packages. Only the surface LocalRunner relies on is implemented:
+    pid, returncode, poll, wait, terminate and kill.
+    """
+
+    def __init__(self, argv: List[str], stdout_fd: Optional[int] = None):
+        """
+        Spawn argv in its own process group.
+
+        Args:
+            argv (List[str]): Command and arguments; argv[0] is resolved
+                via PATH (posix_spawnp).
+            stdout_fd (int, optional): File descriptor to receive the
+                child's stdout and stderr instead of the inherited ones.
+        """
+        file_actions = []
+        if stdout_fd is not None:
+            file_actions = [
+                (os.POSIX_SPAWN_DUP2, stdout_fd, 1),
+                (os.POSIX_SPAWN_DUP2, stdout_fd, 2)
+            ]
+        self.pid = os.posix_spawnp(
+            argv[0], argv, os.environ,
+            file_actions=file_actions,
+            setpgroup=0
+        )
+        self.returncode: Optional[int] = None
+
+    def poll(self) -> Optional[int]:
+        """Return the exit code if the process has exited, else None."""
+        if self.returncode is None:
+            pid, status = os.waitpid(self.pid, os.WNOHANG)
+            if pid == self.pid:
+                self.returncode = os.waitstatus_to_exitcode(status)
+        return self.returncode
+
+    def wait(self, timeout: Optional[float] = None) -> int:
+        """
+        Wait for the process to exit.
+
+        Args:
+            timeout (float, optional): Seconds to wait before raising
+                subprocess.TimeoutExpired, as Popen.wait does.
+
+        Returns:
+            int: The process exit code.
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        while self.poll() is None:
+            if deadline is not None and time.time() > deadline:
+                raise subprocess.TimeoutExpired(cmd=f"pid {self.pid}", timeout=timeout)
+            time.sleep(0.05)
+        return self.returncode
+
+    def terminate(self):
+        """Send SIGTERM to the process."""
+        os.kill(self.pid, signal.SIGTERM)
+
+    def kill(self):
+        """Send SIGKILL to the process."""
+        os.kill(self.pid, signal.SIGKILL)
+
+
+def load_env_file(path: str = ".env"):
+    """
+    Load KEY=VALUE pairs from an env file into os.environ.
+
+    A small inline parser instead of python-dotenv: the file is read in
+    one call and variables already present in the environment are kept,
+    matching load_dotenv's default behavior.
+
+    Args:
+        path (str): Path to the env file.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as env_file:
+            content = env_file.read()
+    except OSError:
+        return
+
+    for line in content.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        key, _, value = line.partition("=")
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "'\"":
+            value = value[1:-1]
+        os.environ.setdefault(key.strip(), value)
 
-load_dotenv()
 
 class LocalRunner:
     """Runner class for local development."""
     
     def __init__(self):
         """Initialize the local runner."""
-        self.processes: List[subprocess.Popen] = []
+        # SpawnedProcess handles, or subprocess.Popen on platforms
+        # without posix_spawn
+        self.processes: List[Any] = []
+        self._shutdown = threading.Event()
+        self._backend_ready = threading.Event()
         self.setup_signal_handlers()
     
     def setup_signal_handlers(self):
         """Setup signal handlers for graceful shutdown."""
         signal.signal(signal.SIGINT, self.signal_handler)
         signal.signal(signal.SIGTERM, self.signal_handler)
+
+        # Self-pipe woken by the kernel on any signal (notably SIGCHLD), so
+        # the monitor can block in select instead of scanning children.
+        # SIGCHLD doesn't exist on Windows; the poll monitor copes without
+        # the wakeup pipe.
+        self._wakeup_r = None
+        self._wakeup_w = None
+        if hasattr(signal, "SIGCHLD"):
+            self._wakeup_r, self._wakeup_w = os.pipe()
+            os.set_blocking(self._wakeup_r, False)
+            os.set_blocking(self._wakeup_w, False)
+            signal.signal(signal.SIGCHLD, lambda *_: None)
+            signal.set_wakeup_fd(self._wakeup_w)
     
     def signal_handler(self, signum, frame):
-        """Handle shutdown signals."""
-        print(f"\\n🛑 Received signal {signum}, shutting down gracefully...")
-        self.cleanup()
-        sys.exit(0)
+        """
+        Record the shutdown request.
+
+        Only an async-signal-safe flag set happens here; printing and
+        process teardown run in the main loop, which the set_wakeup_fd
+        pipe wakes immediately.
+        """
+        self._shutdown.set()
     
     def cleanup(self):
         """Clean up running processes."""
         for process in self.processes:
-            if process.poll() is None:  # Process is still running
-                print(f"🔄 Stopping process {process.pid}...")
+            # Already reaped by the monitor or an earlier cleanup pass
+            if process.returncode is not None:
+                continue
+
+            # Cheap existence check; ESRCH means the child is already gone.
+            # os.kill with signal 0 would terminate the child on Windows,
+            # so use a poll round-trip there instead.
+            if os.name == "posix":
+                try:
+                    os.kill(process.pid, 0)
+                except ProcessLookupError:
+                    continue
+            elif process.poll() is not None:
+                continue
+
+            print(f"🔄 Stopping process {process.pid}...")
+
+            # Signal the whole process group so children spawned by the
+            # child itself (e.g. uvicorn's reload watcher) die too;
+            # platforms without process groups fall back to the handle
+            if hasattr(os, "killpg"):
+                try:
+                    os.killpg(os.getpgid(process.pid), signal.SIGTERM)
+                except (ProcessLookupError, PermissionError):
+                    process.terminate()
+            else:
                 process.terminate()
+
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                if hasattr(os, "killpg"):
+                    try:
+                        os.killpg(os.getpgid(process.pid), signal.SIGKILL)
+                    except (ProcessLookupError, PermissionError):
+                        process.kill()
+                else:
+                    process.kill()
+                # Reap so a later cleanup pass doesn't mistake the zombie
+                # for a live child
                 try:
-                    process.wait(timeout=5)
+                    process.wait(timeout=1)
                 except subprocess.TimeoutExpired:
-                    process.kill()
+                    pass
     
     def check_requirements(self) -> bool:
         """
@@ -63,60 +219,124 @@ class LocalRunner:
             print("   Please set it in your .env file or environment.")
             return False
         
-        # Check if required packages are installed
-        try:
-            import fastapi
-            import streamlit
-            import groq
-            import uvicorn
-        except ImportError as e:
-            print(f"❌ Missing required package: {e}")
+        # Check if required packages are installed without importing them
+        missing = missing_packages()
+        if missing:
+            print(f"❌ Missing required package(s): {', '.join(missing)}")
             print("   Please run: pip install -r requirements.txt")
             return False
-        
+
         return True
     
+    def _spawn(self, argv: List[str], stdout_fd: Optional[int] = None):
+        """
+        Start a child process in its own process group.
+
+        Uses posix_spawn where available (single vfork+exec, no
+        page-table copy); other platforms fall back to subprocess.Popen.
+
+        Args:
+            argv (List[str]): Command and arguments.
+            stdout_fd (int, optional): File descriptor to receive the
+                child's stdout and stderr.
+
+        Returns:
+            SpawnedProcess or subprocess.Popen: Handle to the child.
+        """
+        if hasattr(os, "posix_spawnp"):
+            return SpawnedProcess(argv, stdout_fd=stdout_fd)
+        if stdout_fd is not None:
+            return subprocess.Popen(
+                argv,
+                stdout=stdout_fd,
+                stderr=subprocess.STDOUT,
+                start_new_session=True
+            )
+        return subprocess.Popen(argv, start_new_session=True)
+
     def start_backend(self):
         """Start the FastAPI backend."""
         print("🚀 Starting FastAPI backend...")
         
         backend_cmd = [
-            "uv", "run", sys.executable, "-m", "uvicorn",
+            sys.executable, "-m", "uvicorn",
             "backend.main:app",
             "--host", "0.0.0.0",
             "--port", "8000",
             "--reload"
         ]
-        
-        process = subprocess.Popen(
-            backend_cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            universal_newlines=True
-        )
-        
+
+        # Opt back into the uv wrapper for uv-managed environments
+        if os.getenv("SIMPLE_APP_USE_UV") == "1":
+            backend_cmd = ["uv", "run"] + backend_cmd
+
+        # Capture backend output so readiness can be detected straight
+        # from uvicorn's startup log line; the relay thread echoes
+        # everything to our stdout so the pipe never applies backpressure.
+        read_fd, write_fd = os.pipe()
+        process = self._spawn(backend_cmd, stdout_fd=write_fd)
+        os.close(write_fd)
+
+        threading.Thread(
+            target=self._relay_backend_output,
+            args=(read_fd,),
+            daemon=True
+        ).start()
+
         self.processes.append(process)
         print("✅ Backend started on http://localhost:8000")
         return process
+
+    # uvicorn prints this once the app (lifespan included) is serving
+    _READY_MARKER = b"Application startup complete."
+
+    def _relay_backend_output(self, read_fd: int):
+        """
+        Tail the backend's merged stdout/stderr.
+
+        Echoes every chunk to our stdout, keeping logs visible and the
+        pipe drained, and sets the readiness event as soon as uvicorn's
+        startup-complete line appears.
+
+        Args:
+            read_fd (int): Read end of the backend's output pipe.
+        """
+        with os.fdopen(read_fd, "rb", buffering=0) as pipe:
+            window = b""
+            while True:
+                chunk = pipe.read(65536)
+                if not chunk:
+                    break
+                sys.stdout.buffer.write(chunk)
+                sys.stdout.buffer.flush()
+
+                if not self._backend_ready.is_set():
+                    window += chunk
+                    if self._READY_MARKER in window:
+                        self._backend_ready.set()
+                    else:
+                        # Keep just enough to match a marker split
+                        # across chunks
+                        window = window[-len(self._READY_MARKER):]
     
     def start_frontend(self):
         """Start the Streamlit frontend."""
         print("🚀 Starting Streamlit frontend...")
         
         frontend_cmd = [
-            "uv", "run", sys.executable, "-m", "streamlit",
+            sys.executable, "-m", "streamlit",
             "run", "frontend/app.py",
             "--server.port", "8501",
             "--server.address", "0.0.0.0",
             "--server.headless", "false"
         ]
-        
-        process = subprocess.Popen(
-            frontend_cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            universal_newlines=True
-        )
+
+        # Opt back into the uv wrapper for uv-managed environments
+        if os.getenv("SIMPLE_APP_USE_UV") == "1":
+            frontend_cmd = ["uv", "run"] + frontend_cmd
+
+        # Logs inherit the parent's terminal (see start_backend)
+        process = self._spawn(frontend_cmd)
         
         self.processes.append(process)
         print("✅ Frontend started on http://localhost:8501")
@@ -125,27 +345,174 @@ class LocalRunner:
     def wait_for_backend(self, timeout: int = 30) -> bool:
         """
         Wait for backend to be ready.
-        
+
+        Blocks on the readiness event set by the output relay the moment
+        uvicorn logs "Application startup complete." — observing the
+        event at its source instead of polling a side channel. If the
+        marker never appears (custom log config), a short HTTP probe
+        fallback decides.
+
         Args:
             timeout (int): Maximum time to wait in seconds.
-            
+
         Returns:
             bool: True if backend is ready, False if timeout.
         """
-        import requests
-        
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            try:
-                response = requests.get("http://localhost:8000/health", timeout=2)
-                if response.status_code == 200:
-                    return True
-            except requests.RequestException:
-                pass
-            time.sleep(1)
-        
+        if self._backend_ready.wait(timeout):
+            return True
+
+        return self._wait_for_backend_http(timeout=5)
+
+    def _wait_for_backend_http(self, timeout: int = 30) -> bool:
+        """
+        Probe /health until the backend answers.
+
+        Probes immediately over a reused stdlib HTTP connection — no
+        third-party import on the critical path — then backs off
+        exponentially (50 ms doubling up to 2 s) between failed attempts.
+
+        Args:
+            timeout (int): Maximum time to wait in seconds.
+
+        Returns:
+            bool: True if backend is ready, False if timeout.
+        """
+        import http.client
+
+        conn = http.client.HTTPConnection("localhost", 8000, timeout=1)
+        deadline = time.time() + timeout
+        delay = 0.05
+        try:
+            while time.time() < deadline:
+                try:
+                    conn.request("GET", "/health")
+                    response = conn.getresponse()
+                    response.read()
+                    if response.status == 200:
+                        return True
+                except (OSError, http.client.HTTPException):
+                    # Reset so the next probe reconnects cleanly
+                    conn.close()
+                time.sleep(delay)
+                delay = min(delay * 2, 2.0)
+        finally:
+            conn.close()
+
         return False
     
+    def monitor_processes(self) -> Optional[int]:
+        """
+        Block until any managed process exits or shutdown is requested.
+
+        Returns:
+            Optional[int]: Index of the process that exited, or None if a
+                shutdown signal arrived first.
+        """
+        if hasattr(os, "pidfd_open"):
+            return self._monitor_pidfd()
+        return self._monitor_poll()
+
+    def _monitor_pidfd(self) -> Optional[int]:
+        """
+        Wait for a child exit using pidfd readiness (Linux, Python 3.9+).
+
+        Each child is registered on a selector via os.pidfd_open, so the
+        runner sleeps in the kernel until a child actually exits instead of
+        waking every second to poll.
+
+        Returns:
+            Optional[int]: Index of the process that exited, or None on
+                shutdown.
+        """
+        sel = selectors.DefaultSelector()
+        pidfds = []
+        try:
+            for i, process in enumerate(self.processes):
+                fd = os.pidfd_open(process.pid)
+                pidfds.append(fd)
+                sel.register(fd, selectors.EVENT_READ, data=i)
+            if self._wakeup_r is not None:
+                sel.register(self._wakeup_r, selectors.EVENT_READ, data=None)
+
+            while not self._shutdown.is_set():
+                for key, _ in sel.select(timeout=None):
+                    if key.data is not None:
+                        # A readable pidfd means that child has exited
+                        index = key.data
+                        self.processes[index].poll()
+                        return index
+
+                # Signal wakeup: drain the pipe, then ask the kernel which
+                # child (if any) exited, without reaping it
+                self._drain_wakeup_pipe()
+                index = self._exited_child_index()
+                if index is not None:
+                    return index
+
+            return None
+        finally:
+            for fd in pidfds:
+                os.close(fd)
+            sel.close()
+
+    def _drain_wakeup_pipe(self):
+        """Drain pending signal bytes from the wakeup pipe."""
+        if self._wakeup_r is None:
+            return
+        try:
+            while os.read(self._wakeup_r, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def _exited_child_index(self):
+        """
+        Check for an exited child with a single non-blocking waitid call.
+
+        WNOWAIT leaves the child reapable so Popen.poll can collect its
+        status afterwards.
+
+        Returns:
+            Optional[int]: Index of the exited process, or None.
+        """
+        try:
+            info = os.waitid(os.P_ALL, 0, os.WNOHANG | os.WEXITED | os.WNOWAIT)
+        except ChildProcessError:
+            return None
+
+        if info is None:
+            return None
+
+        for i, process in enumerate(self.processes):
+            if process.pid == info.si_pid:
+                process.poll()
+                return i
+
+        return None
+
+    def _monitor_poll(self) -> Optional[int]:
+        """
+        Fallback poll loop for platforms without pidfd support.
+
+        Uses an adaptive tick: 50 ms right after startup for fast death
+        detection, widening by 1.5x toward a 1 s cap while nothing
+        changes so an idle runner stays cheap. Waiting on the shutdown
+        event keeps Ctrl+C responsive at any tick width.
+
+        Returns:
+            Optional[int]: Index of the process that exited, or None on
+                shutdown.
+        """
+        delay = 0.05
+        while not self._shutdown.wait(delay):
+            # Check if any process has died
+            for i, process in enumerate(self.processes):
+                if process.poll() is not None:
+                    return i
+            delay = min(delay * 1.5, 1.0)
+
+        return None
+
     def run(self):
         """Run the complete application stack."""
         print("🎯 Simple Groq App - Local Development Runner")
@@ -177,16 +544,14 @@ class LocalRunner:
             print("=" * 50)
             print("\\n💡 Press Ctrl+C to stop all services\\n")
             
-            # Monitor processes
-            while True:
-                time.sleep(1)
-                
-                # Check if any process has died
-                for i, process in enumerate(self.processes):
-                    if process.poll() is not None:
-                        print(f"❌ Process {i} has stopped unexpectedly")
-                        self.cleanup()
-                        return False
+            # Monitor until a child exits or a shutdown signal arrives
+            index = self.monitor_processes()
+            if index is not None:
+                print(f"❌ Process {index} has stopped unexpectedly")
+                self.cleanup()
+                return False
+
+            print("\\n🛑 Received shutdown signal, shutting down gracefully...")
         
         except KeyboardInterrupt:
             print("\\n🛑 Received interrupt signal")
@@ -200,6 +565,7 @@ class LocalRunner:
 
 def main():
     """Main function."""
+    load_env_file()
     runner = LocalRunner()
     success = runner.run()
     sys.exit(0 if success else 1)